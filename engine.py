@@ -19,25 +19,21 @@ import os
 import sys
 import time
 import atexit
+import collections
+import functools
 import logging
+import importlib
+import importlib.util
 import traceback
 
-import tank
+# The Engine base class and the logger are needed as soon as this module is
+# loaded, the rest of tank is imported by the functions that use it.
 from tank.log import LogManager
 from tank.platform import Engine
-from tank.util import is_windows, is_linux, is_macos
 
 import bpy
 from bpy.app.handlers import persistent
 
-# ---------------------------------------------------------------------
-# NEW: Attempt direct PySide2 import, then fall back to PySide6
-# ---------------------------------------------------------------------
-try:
-    from PySide2 import QtCore, QtGui, QtWidgets
-except ImportError:
-    from PySide6 import QtCore, QtGui, QtWidgets
-
 __author__ = "Diego Garcia Huerta"
 __contact__ = "https://www.linkedin.com/in/diegogh/"
 
@@ -52,8 +48,65 @@ SHOW_COMP_DLG = "SGTK_COMPATIBILITY_DIALOG_SHOWN"
 # this is the absolute minimum Blender version for the engine to work.
 MIN_COMPATIBILITY_VERSION = 2.8
 
+# number of apps added to the Shotgun menu on each tick of Blender's event
+# loop while the menu is being built.
+MENU_BATCH_SIZE = 5
+
 logger = LogManager.get_logger(__name__)
 
+# formatters used when emitting the Toolkit log records to the console
+_DEBUG_FORMATTER = logging.Formatter("Debug: Shotgun %(basename)s: %(message)s")
+_INFO_FORMATTER = logging.Formatter("Shotgun %(basename)s: %(message)s")
+
+# The Qt modules are only imported the first time they are needed, so that
+# batch sessions of Blender that never show a dialog do not pay for them.
+_QT_MODULE_NAMES = ("QtCore", "QtGui", "QtWidgets")
+_QT_MODULES = {}
+_QT_BINDING = None
+
+
+def _qt_binding():
+    """
+    Returns the Qt binding package, PySide2 if it can be found or else
+    PySide6. The lookup only happens once; the result is cached.
+    """
+    global _QT_BINDING
+    if _QT_BINDING is None:
+        # find_spec locates the package without executing it, so PySide2 is
+        # only imported when it is installed. If that install is broken we
+        # still fall back to PySide6.
+        if importlib.util.find_spec("PySide2"):
+            try:
+                _QT_BINDING = importlib.import_module("PySide2")
+            except ImportError:
+                _QT_BINDING = importlib.import_module("PySide6")
+        else:
+            _QT_BINDING = importlib.import_module("PySide6")
+    return _QT_BINDING
+
+
+def _load_qt():
+    """
+    Returns a dictionary with the QtCore, QtGui and QtWidgets modules of the
+    Qt binding, importing them on first use.
+    """
+    if not _QT_MODULES:
+        binding = _qt_binding()
+        for name in _QT_MODULE_NAMES:
+            _QT_MODULES[name] = importlib.import_module(
+                "%s.%s" % (binding.__name__, name)
+            )
+    return _QT_MODULES
+
+
+def __getattr__(name):
+    """
+    Resolves the Qt modules lazily when accessed as attributes of this module.
+    """
+    if name in _QT_MODULE_NAMES:
+        return _load_qt()[name]
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
 
 def display_message(level, msg):
     t = time.asctime(time.localtime())
@@ -77,6 +130,25 @@ def display_debug(msg):
         display_message("Debug", msg)
 
 
+# display function for each log level, highest level first. The last entry
+# catches every level below INFO.
+_LEVEL_DISPLAY_FUNCTIONS = (
+    (logging.ERROR, display_error),
+    (logging.WARNING, display_warning),
+    (logging.INFO, display_info),
+    (logging.NOTSET, display_debug),
+)
+
+
+# path of the file the engine context was last refreshed from, used to skip
+# the refresh on successive saves of the same file.
+_LAST_REFRESH_PATH = None
+
+# whether on_scene_event_callback is currently registered as a load/save
+# handler in Blender.
+_HANDLERS_REGISTERED = False
+
+
 @persistent
 def on_scene_event_callback(*args, **kwargs):
     """
@@ -93,13 +165,21 @@ def on_scene_event_callback(*args, **kwargs):
             "Message: Shotgun encountered a problem changing the Engine's context.\n"
         )
         message += "Please contact support@shotgunsoftware.com\n\n"
-        message += "Exception: %s - %s\n" % (exc_type, exc_value)
-        message += "Traceback (most recent call last):\n"
-        message += "\n".join(traceback.format_tb(exc_traceback))
+        message += "Exception: %s" % "".join(
+            traceback.format_exception_only(exc_type, exc_value)
+        )
+
+        # formatting the traceback reads the source of every frame, only do
+        # it when debugging is enabled.
+        if os.environ.get("TK_DEBUG") == "1":
+            message += "Traceback (most recent call last):\n"
+            message += "\n".join(traceback.format_tb(exc_traceback))
 
         # If a QApplication is running, show a critical message box:
-        if QtWidgets.QApplication.instance():
-            QtWidgets.QMessageBox.critical(None, ENGINE_NICE_NAME, message)
+        if not bpy.app.background:
+            QtWidgets = _load_qt()["QtWidgets"]
+            if QtWidgets.QApplication.instance() is not None:
+                QtWidgets.QMessageBox.critical(None, ENGINE_NICE_NAME, message)
 
         print(message)
 
@@ -108,9 +188,19 @@ def setup_app_handlers():
     """
     Set up Blender callbacks for scene load/save to refresh the engine.
     """
+    global _HANDLERS_REGISTERED
+
     teardown_app_handlers()
+
+    # there is no menu to keep up to date in batch mode
+    if bpy.app.background:
+        logger.debug("Blender runs in background mode; skipping app handlers.")
+        return
+
     bpy.app.handlers.load_post.append(on_scene_event_callback)
     bpy.app.handlers.save_post.append(on_scene_event_callback)
+    _HANDLERS_REGISTERED = True
+    logger.debug("Registered open/save callbacks for automatic context.")
     atexit.register(teardown_app_handlers)
 
 
@@ -118,17 +208,33 @@ def teardown_app_handlers():
     """
     Remove the previously registered handlers (if present).
     """
+    global _LAST_REFRESH_PATH, _HANDLERS_REGISTERED
+    _LAST_REFRESH_PATH = None
+
+    # nothing to look for in Blender's handler lists if we never added ours
+    if not _HANDLERS_REGISTERED:
+        return
+
     if on_scene_event_callback in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(on_scene_event_callback)
 
     if on_scene_event_callback in bpy.app.handlers.save_post:
         bpy.app.handlers.save_post.remove(on_scene_event_callback)
 
+    _HANDLERS_REGISTERED = False
+
 
 def refresh_engine():
     """
     Refresh the current engine based on the current file path/context.
     """
+    import tank
+
+    global _LAST_REFRESH_PATH
+
+    if bpy.app.background:
+        return
+
     logger.debug("Refreshing the engine")
 
     engine = tank.platform.current_engine()
@@ -144,6 +250,10 @@ def refresh_engine():
     scene_name = os.path.abspath(scene_name)
     current_context = engine.context
 
+    if scene_name == _LAST_REFRESH_PATH and current_context is not None:
+        logger.debug("File path unchanged since last refresh; aborting refresh.")
+        return
+
     try:
         tk = tank.sgtk_from_path(scene_name)
         logger.debug("Extracted sgtk instance '%r' from path '%r'", tk, scene_name)
@@ -180,6 +290,9 @@ def refresh_engine():
             )
             display_warning(message)
             engine.create_shotgun_menu(disabled=True)
+            return
+
+    _LAST_REFRESH_PATH = scene_name
 
 
 class BlenderEngine(Engine):
@@ -191,16 +304,18 @@ class BlenderEngine(Engine):
         self._qt_app = None
         self._qt_app_main_window = None
         self._menu_generator = None
+        self._last_stylesheet = None
+        self._pending_stylesheet = None
+        self._dark_applied = False
+        self._qicon = None
         Engine.__init__(self, *args, **kwargs)
 
     def show_message(self, msg, level="info"):
         """
         Displays a dialog with the message according to the severity level.
         """
-        try:
-            from PySide2 import QtCore, QtGui, QtWidgets
-        except ImportError:
-            from PySide6 import QtCore, QtGui, QtWidgets
+        qt = _load_qt()
+        QtCore, QtWidgets = qt["QtCore"], qt["QtWidgets"]
 
         level_icon = {
             "info": QtWidgets.QMessageBox.Information,
@@ -248,10 +363,17 @@ class BlenderEngine(Engine):
         self.logger.debug("Initializing engine... %s", self)
 
         self.tk_blender = self.import_module("tk_blender")
-        self.init_qt_app()
+
+        # there is no UI to show dialogs in batch mode, leave Qt alone
+        if not self.has_ui:
+            return
+
+        self._ensure_qapp()
+        self._apply_style()
 
         # In older PySide2 code, you might set QTextCodec to handle unicode from SG.
         # PySide6 removed QTextCodec. If you need it, wrap in a check:
+        QtCore = _load_qt()["QtCore"]
         if hasattr(QtCore, "QTextCodec"):
             utf8 = QtCore.QTextCodec.codecForName("utf-8")
             QtCore.QTextCodec.setCodecForCStrings(utf8)
@@ -261,6 +383,9 @@ class BlenderEngine(Engine):
         """
         Initializes the Blender engine (checks OS, Blender version, etc.).
         """
+        import tank
+        from tank.util import is_windows, is_linux, is_macos
+
         self.logger.debug("%s: Initializing...", self)
 
         # check if OS is supported
@@ -287,7 +412,6 @@ class BlenderEngine(Engine):
 
         if self.get_setting("automatic_context_switch", True):
             setup_app_handlers()
-            self.logger.debug("Registered open/save callbacks for automatic context.")
 
     def create_shotgun_menu(self, disabled=False):
         """
@@ -295,9 +419,14 @@ class BlenderEngine(Engine):
         """
         if self.has_ui:
             self.logger.debug("Creating Shotgun menu...")
-            tk_blender = self.import_module("tk_blender")
-            self._menu_generator = tk_blender.MenuGenerator(self, self._menu_name)
-            self._menu_generator.create_menu(disabled=disabled)
+            # reuse the generator, so a rebuild stops the pending batches of
+            # the previous build.
+            if self._menu_generator is None:
+                tk_blender = self.import_module("tk_blender")
+                self._menu_generator = tk_blender.MenuGenerator(self, self._menu_name)
+            self._menu_generator.create_menu(
+                disabled=disabled, batch_size=MENU_BATCH_SIZE
+            )
         return False
 
     def display_menu(self, pos=None):
@@ -308,64 +437,110 @@ class BlenderEngine(Engine):
             self._menu_generator.show(pos)
 
     def init_qt_app(self):
+        """
+        Ensure the QApplication is initialized, create a main window and
+        style it to match Blender.
+        """
+        self._ensure_qapp()
+        self._apply_style()
+
+    def _ensure_qapp(self):
         """
         Ensure the QApplication is initialized and create a main window.
+        Cheap to call more than once.
         """
+        qt = _load_qt()
+        QtGui, QtWidgets = qt["QtGui"], qt["QtWidgets"]
+
         # if there is an existing Qt app, reuse it
         self._qt_app = QtWidgets.QApplication.instance()
         if not self._qt_app:
             # Usually Blender engine sets up QApplication in a separate script/operator
             self._qt_app = QtWidgets.QApplication(sys.argv)
 
-        # set a window icon if desired
-        self._qt_app.setWindowIcon(QtGui.QIcon(self.icon_256))
+        # set a window icon if desired, decoding the icon only once
+        if self._qicon is None:
+            self._qicon = QtGui.QIcon(self.icon_256)
+        self._qt_app.setWindowIcon(self._qicon)
         self._qt_app.setQuitOnLastWindowClosed(False)
 
         if self._qt_app_main_window is None:
             self.log_debug("Initializing main QApplication window...")
 
             self._qt_app_main_window = QtWidgets.QMainWindow()
-            # On Windows, try to parent under Blender’s main window
-            if is_windows():
-                import ctypes
-
-                hwnd = ctypes.windll.user32.GetActiveWindow()
-                if hwnd:
-                    # Some code to embed might go here if needed
-                    pass
-
             self._qt_app_central_widget = QtWidgets.QWidget()
             self._qt_app_main_window.setCentralWidget(self._qt_app_central_widget)
 
-        # set up the dark style
-        self._initialize_dark_look_and_feel()
+        self.logger.debug("QT Application: %s", self._qt_app_main_window)
+
+    def _apply_style(self):
+        """
+        Apply the dark look and feel and Blender's font size to the
+        QApplication.
+        """
+        # set up the dark style, it walks the whole widget tree so only do
+        # it once.
+        if not self._dark_applied:
+            self._initialize_dark_look_and_feel()
+            self._dark_applied = True
 
         # try to match Blender's font size
+        prefs = bpy.context.preferences
+        styles = prefs.ui_styles
+        ui_scale = prefs.system.ui_scale
+
         text_size = 9
-        if len(bpy.context.preferences.ui_styles) > 0:
+        if len(styles) > 0:
             self.log_debug("Applying Blender UI style to QApplication...")
-            text_size = bpy.context.preferences.ui_styles[0].widget.points - 2
+            text_size = styles[0].widget.points - 2
 
-        ui_scale = bpy.context.preferences.system.ui_scale
         text_size *= ui_scale
-        self._qt_app.setStyleSheet(
-            f""".QMenu {{ font-size: {text_size}pt; }}
+        stylesheet = f""".QMenu {{ font-size: {text_size}pt; }}
                 .QWidget {{ font-size: {text_size}pt; }}"""
-        )
 
-        self.logger.debug("QT Application: %s", self._qt_app_main_window)
+        # setting a stylesheet re-polishes every widget, skip it if the
+        # resulting stylesheet is already applied or about to be, and
+        # otherwise defer it to a Blender timer so the engine initialization
+        # is not held up by it. Blender's own event loop runs the timer,
+        # there is no guarantee a Qt one is running at this point. The timer
+        # is persistent so loading a file does not remove it.
+        if stylesheet not in (self._last_stylesheet, self._pending_stylesheet):
+            self._pending_stylesheet = stylesheet
+            bpy.app.timers.register(
+                functools.partial(self._set_stylesheet, stylesheet),
+                first_interval=0,
+                persistent=True,
+            )
+
+    def _set_stylesheet(self, stylesheet):
+        """
+        Applies the stylesheet to the QApplication, unless a newer one has
+        been scheduled since. Runs from a Blender timer, returning None so
+        the timer only runs once.
+        """
+        if stylesheet == self._pending_stylesheet:
+            self._qt_app.setStyleSheet(stylesheet)
+            self._last_stylesheet = stylesheet
+            self._pending_stylesheet = None
+        return None
 
     def post_app_init(self):
         """
         Called after all apps have initialized.
         """
+        import tank
+
         tank.platform.engine.set_current_engine(self)
+
+        # the app entries of the menu are added in batches from Blender
+        # timers, so that its UI is not held up by building it.
         self.create_shotgun_menu()
 
         # close windows created by the engine on exit
-        app = QtWidgets.QApplication.instance()
-        if app:
-            app.aboutToQuit.connect(self.destroy_engine)
+        if self.has_ui:
+            app = _load_qt()["QtWidgets"].QApplication.instance()
+            if app:
+                app.aboutToQuit.connect(self.destroy_engine)
 
         # Run configured startup commands
         self._run_app_instance_commands()
@@ -374,6 +549,8 @@ class BlenderEngine(Engine):
         """
         Runs after a context change. Rebuilds menus if needed.
         """
+        import tank
+
         if self.get_setting("automatic_context_switch", True):
             setup_app_handlers()
             if old_context != new_context:
@@ -390,18 +567,29 @@ class BlenderEngine(Engine):
         """
         Runs app instance commands listed in 'run_at_startup' from the environment config.
         """
-        app_instance_commands = {}
+        run_at_startup = self.get_setting("run_at_startup", [])
+        if not run_at_startup:
+            return
+
+        # only collect the commands of the apps that are referenced
+        startup_app_names = set(
+            app_setting_dict["app_instance"] for app_setting_dict in run_at_startup
+        )
+
+        app_instance_commands = collections.defaultdict(dict)
         for (cmd_name, value) in self.commands.items():
             app_instance = value["properties"].get("app")
-            if app_instance:
-                cmd_dict = app_instance_commands.setdefault(app_instance.instance_name, {})
-                cmd_dict[cmd_name] = value["callback"]
+            if app_instance and app_instance.instance_name in startup_app_names:
+                app_instance_commands[app_instance.instance_name][cmd_name] = value[
+                    "callback"
+                ]
 
-        for app_setting_dict in self.get_setting("run_at_startup", []):
+        get_app_commands = app_instance_commands.get
+        for app_setting_dict in run_at_startup:
             app_instance_name = app_setting_dict["app_instance"]
             setting_cmd_name = app_setting_dict["name"]
 
-            cmd_dict = app_instance_commands.get(app_instance_name)
+            cmd_dict = get_app_commands(app_instance_name)
             if cmd_dict is None:
                 self.logger.warning(
                     "%s 'run_at_startup' requests app '%s' which is not installed.",
@@ -465,20 +653,14 @@ class BlenderEngine(Engine):
         Called by the engine to log messages.
         """
         if record.levelno < logging.INFO:
-            formatter = logging.Formatter("Debug: Shotgun %(basename)s: %(message)s")
+            formatter = _DEBUG_FORMATTER
         else:
-            formatter = logging.Formatter("Shotgun %(basename)s: %(message)s")
+            formatter = _INFO_FORMATTER
 
         msg = formatter.format(record)
 
-        if record.levelno >= logging.ERROR:
-            fct = display_error
-        elif record.levelno >= logging.WARNING:
-            fct = display_warning
-        elif record.levelno >= logging.INFO:
-            fct = display_info
-        else:
-            fct = display_debug
+        levelno = record.levelno
+        fct = next(fn for (level, fn) in _LEVEL_DISPLAY_FUNCTIONS if levelno >= level)
 
         self.async_execute_in_main_thread(fct, msg)
 
@@ -19,6 +19,8 @@ Menu handling for this engine
 import sys
 import subprocess
 
+import bpy
+
 import tank
 from tank.util import is_windows, is_linux, is_macos
 from tank.platform.qt import QtGui, QtCore
@@ -74,6 +76,9 @@ class MenuGenerator(object):
         self._engine = engine
         self._menu_name = menu_name
         self._handle = QtGui.QMenu(self._menu_name)
+        # incremented on every build, so pending batches of a previous build
+        # know the menu has been rebuilt since.
+        self._build_id = 0
 
     def hide(self):
         self.menu_handle.hide()
@@ -85,11 +90,16 @@ class MenuGenerator(object):
         self._handle.raise_()
         self._handle.exec_(pos)
 
-    def create_menu(self, disabled=False):
+    def create_menu(self, disabled=False, batch_size=None):
         """
         Render the entire Shotgun menu.
         In order to have commands enable/disable themselves based on the
         enable_callback, re-create the menu items every time.
+
+        :param bool disabled: Only show a disabled entry in the menu.
+        :param int batch_size: (optional) Number of apps to add to the menu on
+                               each tick of Blender's event loop. All apps
+                               are added at once when not specified.
         """
 
         # there is a slight chance we could not create the QMenu, so check
@@ -98,9 +108,17 @@ class MenuGenerator(object):
             return
 
         self._handle.clear()
+        self._build_id += 1
+
+        # clear() only removes the actions, the sub menus are child widgets
+        # of the menu and have to be deleted explicitly.
+        for sub_menu in self._handle.findChildren(QtGui.QMenu):
+            sub_menu.deleteLater()
 
         if disabled:
             self._handle.addMenu("Sgtk is disabled.")
+            # a build interrupted by this one may have left it disabled
+            self._handle.setEnabled(True)
             return
 
         self._handle.setEnabled(False)
@@ -158,6 +176,11 @@ class MenuGenerator(object):
                 commands_by_app[app_name].append(cmd)
 
         # now add all apps to main menu
+        if batch_size:
+            # the menu gets enabled once the last batch is added
+            self._add_app_menu_in_batches(commands_by_app, batch_size)
+            return
+
         self._add_app_menu(commands_by_app)
 
         self._handle.setEnabled(True)
@@ -259,27 +282,68 @@ class MenuGenerator(object):
         Add all apps to the main menu, process them one by one.
         """
         for app_name in sorted(commands_by_app.keys()):
-            if len(commands_by_app[app_name]) > 1:
-                # more than one menu entry fort his app
-                # make a sub menu and put all items in the sub menu
-                app_menu = self._add_sub_menu(app_name, self._handle)
-
-                # get the list of menu cmds for this app
-                cmds = commands_by_app[app_name]
-                # make sure it is in alphabetical order
-                cmds.sort(key=lambda x: x.name)
-
-                for cmd in cmds:
-                    cmd.add_command_to_menu(app_menu)
-            else:
-                # this app only has a single entry.
-                # display that on the menu
-                cmd_obj = commands_by_app[app_name][0]
-                if not cmd_obj.favourite:
-                    # skip favourites since they are already on the menu
-                    cmd_obj.add_command_to_menu(self._handle)
+            self._add_app_menu_entry(app_name, commands_by_app[app_name])
         self._add_divider(self._handle)
 
+    def _add_app_menu_in_batches(self, commands_by_app, batch_size):
+        """
+        Add all apps to the main menu, `batch_size` apps on each tick of
+        Blender's event loop so building a large menu does not block the UI.
+        The menu is enabled once all the apps have been added.
+
+        Blender timers are used rather than Qt ones, as there is no guarantee
+        a Qt event loop is running while the menu is not shown.
+        """
+        build_id = self._build_id
+        app_names = sorted(commands_by_app.keys())
+        start = 0
+
+        def add_batch():
+            nonlocal start
+
+            # the menu has been rebuilt since this batch was scheduled
+            if build_id != self._build_id:
+                return None
+
+            end = start + batch_size
+            for app_name in app_names[start:end]:
+                self._add_app_menu_entry(app_name, commands_by_app[app_name])
+            start = end
+
+            if start < len(app_names):
+                # run again on the next tick
+                return 0.0
+
+            self._add_divider(self._handle)
+            self._handle.setEnabled(True)
+            return None
+
+        # persistent, so that loading a file before the menu is complete does
+        # not remove the timer.
+        bpy.app.timers.register(add_batch, first_interval=0.0, persistent=True)
+
+    def _add_app_menu_entry(self, app_name, cmds):
+        """
+        Add the commands of a single app to the main menu.
+        """
+        if len(cmds) > 1:
+            # more than one menu entry fort his app
+            # make a sub menu and put all items in the sub menu
+            app_menu = self._add_sub_menu(app_name, self._handle)
+
+            # make sure it is in alphabetical order
+            cmds.sort(key=lambda x: x.name)
+
+            for cmd in cmds:
+                cmd.add_command_to_menu(app_menu)
+        else:
+            # this app only has a single entry.
+            # display that on the menu
+            cmd_obj = cmds[0]
+            if not cmd_obj.favourite:
+                # skip favourites since they are already on the menu
+                cmd_obj.add_command_to_menu(self._handle)
+
 
 class AppCommand(object):
     """
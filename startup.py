@@ -12,6 +12,7 @@
 
 import os
 import sys
+import importlib.util
 
 import sgtk
 from sgtk.platform import SoftwareLauncher, SoftwareVersion, LaunchInformation
@@ -19,28 +20,43 @@ from sgtk.platform import SoftwareLauncher, SoftwareVersion, LaunchInformation
 __author__ = "Diego Garcia Huerta"
 __contact__ = "https://www.linkedin.com/in/diegogh/"
 
-# We store the location of PySide2 or 6 module in the site-packages.path file.
-# This is so the resources/scripts/startup/Shotgun_menu.py can fine this
-# location when it loads the ShotGun menu within Blender. It needs to load
-# the same module, from the same location. If you install PySide6 in the users
-# site-packages folder, this seems to prevent ShotGun from launching.
-for path in sys.path:
-    if "site-packages" in path and any(os.path.isdir(os.path.join(path, pkg))
-                                      for pkg in ("PySide2", "PySide6")):
-        site_packages_path = path
-        break
-
-if site_packages_path:
+
+def _write_site_packages_path():
+    """
+    Stores the location of the PySide2 or 6 module in the site-packages.path
+    file.
+
+    This is so the resources/scripts/startup/Shotgun_menu.py can find this
+    location when it loads the ShotGun menu within Blender. It needs to load
+    the same module, from the same location. If you install PySide6 in the
+    users site-packages folder, this seems to prevent ShotGun from launching.
+    """
+    spec = importlib.util.find_spec("PySide2") or importlib.util.find_spec("PySide6")
+    if not spec or not spec.origin:
+        return
+
+    # origin points to <site-packages>/PySide*/__init__.py
+    site_packages_path = os.path.dirname(os.path.dirname(spec.origin))
+
     path_file = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)),
-        "site-packages.path"
+        os.path.dirname(os.path.abspath(__file__)), "site-packages.path"
     )
+
+    # only rewrite the file when the location has changed
+    try:
+        with open(path_file, "r") as file:
+            if file.read().strip() == site_packages_path:
+                return
+    except OSError:
+        pass
+
     try:
         with open(path_file, "w") as file:
             file.write(site_packages_path)
     except Exception as e:
         print(f"Could not save site-packages.path: {e}")
 
+
 class BlenderLauncher(SoftwareLauncher):
     """
     Handles launching Blender executables. Automatically starts up
@@ -51,7 +67,10 @@ class BlenderLauncher(SoftwareLauncher):
     # Named regex strings to insert into the executable template paths when
     # matching against supplied versions and products. Similar to the glob
     # strings, these allow us to alter the regex matching for any of the
-    # variable components of the path in one place
+    # variable components of the path in one place.
+    # These must stay plain strings: _glob_and_match formats them into the
+    # executable template and compiles the resulting pattern once per
+    # template, and _find_software caches the outcome of the whole scan.
     COMPONENT_REGEX_LOOKUP = {"version": r"\d.\d+(.\d*)*"}
 
     # This dictionary defines a list of executable template strings for each
@@ -78,6 +97,15 @@ class BlenderLauncher(SoftwareLauncher):
         "linux2": ["$BLENDER_BIN_DIR/blender", "/usr/share/blender/blender"],
     }
 
+    def __init__(self, *args, **kwargs):
+        super(BlenderLauncher, self).__init__(*args, **kwargs)
+
+        # (cache key, SoftwareVersion list) of the last filesystem scan
+        self._software_cache = None
+
+        # the engine icon, shared by every SoftwareVersion found
+        self._engine_icon_path = os.path.join(self.disk_location, "icon_256.png")
+
     @property
     def minimum_supported_version(self):
         """
@@ -96,6 +124,8 @@ class BlenderLauncher(SoftwareLauncher):
                                  launch.
         :returns: :class:`LaunchInformation` instance
         """
+        _write_site_packages_path()
+
         required_env = {}
 
         # Run the engine's startup file file when Blender starts up
@@ -145,10 +175,7 @@ class BlenderLauncher(SoftwareLauncher):
 
         :returns: Full path to application icon as a string or None.
         """
-
-        # the engine icon
-        engine_icon = os.path.join(self.disk_location, "icon_256.png")
-        return engine_icon
+        return self._engine_icon_path
 
     def scan_software(self):
         """
@@ -173,6 +200,59 @@ class BlenderLauncher(SoftwareLauncher):
     def _find_software(self):
         """
         Find executables in the default install locations.
+
+        The result of the scan is cached and reused for as long as the
+        environment and the install locations are left untouched.
+        """
+        cache_key = self._software_cache_key()
+        if self._software_cache and self._software_cache[0] == cache_key:
+            self.logger.debug("Reusing cached Blender executables.")
+            return self._software_cache[1]
+
+        sw_versions = self._scan_executable_templates()
+        self._software_cache = (cache_key, sw_versions)
+        return sw_versions
+
+    def _template_parent_dirs(self):
+        """
+        Returns the deepest static folder of each executable template for
+        the current OS, that is, the folder that would change if a Blender
+        version was installed or removed.
+        """
+        parent_dirs = []
+        for executable_template in self.EXECUTABLE_TEMPLATES.get(sys.platform, []):
+            executable_template = os.path.expanduser(executable_template)
+            executable_template = os.path.expandvars(executable_template)
+            static_part = executable_template.split("{", 1)[0]
+            parent_dirs.append(os.path.dirname(static_part))
+        return parent_dirs
+
+    def _software_cache_key(self):
+        """
+        Builds the key used to decide if the cached executables are still
+        valid: the environment variables the templates depend on, and the
+        modification times of the folders they are found in.
+        """
+        dir_mtimes = []
+        for parent_dir in self._template_parent_dirs():
+            try:
+                dir_mtimes.append((parent_dir, os.path.getmtime(parent_dir)))
+            except OSError:
+                # folder does not exist (yet)
+                continue
+
+        return (
+            sys.platform,
+            os.environ.get("BLENDER_BIN_DIR"),
+            os.environ.get("USERPROFILE"),
+            os.environ.get("SGTK_BLENDER_CMD_EXTRA_ARGS"),
+            tuple(dir_mtimes),
+        )
+
+    def _scan_executable_templates(self):
+        """
+        Glob the executable templates for the current OS and build a
+        :class:`SoftwareVersion` for each executable found.
         """
 
         # all the executable templates for the current OS
@@ -12,11 +12,17 @@
 
 import os
 import sys
+import importlib.util
+import io
+import glob
+import time
+import hashlib
 import tempfile
 import subprocess
 
 import sgtk
 from sgtk.platform import SoftwareLauncher, SoftwareVersion, LaunchInformation
+from sgtk.util import filesystem, LocalFileStorageManager
 
 ################################################################################
 # RUN STARTUP WITH macOS TERMINAL LOGGING                                      #
@@ -25,28 +31,47 @@ from sgtk.platform import SoftwareLauncher, SoftwareVersion, LaunchInformation
 __author__ = "Diego Garcia Huerta"
 __contact__ = "https://www.linkedin.com/in/diegogh/"
 
-# We store the location of PySide2 or 6 module in the site-packages.path file.
-# This is so the resources/scripts/startup/Shotgun_menu.py can fine this
-# location when it loads the ShotGun menu within Blender. It needs to load
-# the same module, from the same location. If you install PySide6 in the users
-# site-packages folder, this seems to prevent ShotGun from launching.
-for path in sys.path:
-    if "site-packages" in path and any(os.path.isdir(os.path.join(path, pkg))
-                                      for pkg in ("PySide2", "PySide6")):
-        site_packages_path = path
-        break
-
-if site_packages_path:
+# launch scripts older than this many seconds are removed from the cache
+# folder on the next launch.
+LAUNCH_SCRIPT_MAX_AGE = 60 * 60
+
+
+def _write_site_packages_path():
+    """
+    Stores the location of the PySide2 or 6 module in the site-packages.path
+    file.
+
+    This is so the resources/scripts/startup/Shotgun_menu.py can find this
+    location when it loads the ShotGun menu within Blender. It needs to load
+    the same module, from the same location. If you install PySide6 in the
+    users site-packages folder, this seems to prevent ShotGun from launching.
+    """
+    spec = importlib.util.find_spec("PySide2") or importlib.util.find_spec("PySide6")
+    if not spec or not spec.origin:
+        return
+
+    # origin points to <site-packages>/PySide*/__init__.py
+    site_packages_path = os.path.dirname(os.path.dirname(spec.origin))
+
     path_file = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)),
-        "site-packages.path"
+        os.path.dirname(os.path.abspath(__file__)), "site-packages.path"
     )
+
+    # only rewrite the file when the location has changed
+    try:
+        with open(path_file, "r") as file:
+            if file.read().strip() == site_packages_path:
+                return
+    except OSError:
+        pass
+
     try:
         with open(path_file, "w") as file:
             file.write(site_packages_path)
     except Exception as e:
         print(f"Could not save site-packages.path: {e}")
 
+
 class BlenderLauncher(SoftwareLauncher):
     """
     Handles launching Blender executables. Automatically starts up
@@ -57,7 +82,10 @@ class BlenderLauncher(SoftwareLauncher):
     # Named regex strings to insert into the executable template paths when
     # matching against supplied versions and products. Similar to the glob
     # strings, these allow us to alter the regex matching for any of the
-    # variable components of the path in one place
+    # variable components of the path in one place.
+    # These must stay plain strings: _glob_and_match formats them into the
+    # executable template and compiles the resulting pattern once per
+    # template, and _find_software caches the outcome of the whole scan.
     COMPONENT_REGEX_LOOKUP = {"version": r"\d.\d+(.\d*)*"}
 
     # This dictionary defines a list of executable template strings for each
@@ -84,6 +112,15 @@ class BlenderLauncher(SoftwareLauncher):
         "linux2": ["$BLENDER_BIN_DIR/blender", "/usr/share/blender/blender"],
     }
 
+    def __init__(self, *args, **kwargs):
+        super(BlenderLauncher, self).__init__(*args, **kwargs)
+
+        # (cache key, SoftwareVersion list) of the last filesystem scan
+        self._software_cache = None
+
+        # the engine icon, shared by every SoftwareVersion found
+        self._engine_icon_path = os.path.join(self.disk_location, "icon_256.png")
+
     @property
     def minimum_supported_version(self):
         return "2.8"
@@ -99,6 +136,8 @@ class BlenderLauncher(SoftwareLauncher):
                                  launch.
         :returns: :class:`LaunchInformation` instance
         """
+        _write_site_packages_path()
+
         required_env = {}
 
         # Example: standard environment-building from your existing code
@@ -124,41 +163,86 @@ class BlenderLauncher(SoftwareLauncher):
 
         # Build a small shell script that sets env vars, then calls Blender. This
         # is the bit which forces logging from Blender to appear in macOS terminal
-        shell_script_lines = [
-            "#!/bin/bash\n",
-            "# Auto-generated script to launch Blender in a Terminal\n",
-        ]
+        script_buffer = io.StringIO()
+        script_buffer.write("#!/bin/bash\n")
+        script_buffer.write("# Auto-generated script to launch Blender in a Terminal\n")
         # Export each environment variable
         for key, val in required_env.items():
             val_escaped = val.replace('"', '\\"')
-            shell_script_lines.append(f'export {key}="{val_escaped}"\n')
-        shell_script_lines.append(f'"{exec_path}" {args}\n')
-        shell_script_lines.append('read -p "Press [Enter] to close this window..."\n')
-
-        # Write this script to a temp file
-        tmp_file = tempfile.NamedTemporaryFile(delete=False, mode="w", prefix="blender_launch_", suffix=".sh")
-        script_path = tmp_file.name
-        tmp_file.writelines(shell_script_lines)
-        tmp_file.close()
-
-        # Make it executable
-        os.chmod(script_path, 0o755)
-
-        # Use AppleScript to open a new Terminal window that runs our script
-        apple_script = f'''
-            tell application "Terminal"
-                activate
-                do script "{script_path}"
-            end tell
-        '''
-        # Launch the AppleScript (async).
-        subprocess.Popen(["osascript", "-e", apple_script])
+            script_buffer.write(f'export {key}="{val_escaped}"\n')
+        script_buffer.write(f'"{exec_path}" {args}\n')
+        script_buffer.write('read -p "Press [Enter] to close this window..."\n')
+
+        # Write this script to the cache folder, named after a hash of its
+        # contents, so launching with the same environment reuses it.
+        script_path = self._write_launch_script(script_buffer.getvalue())
+
+        # Open a new Terminal window that runs our script (async). Terminal
+        # executes the script itself, no AppleScript is involved.
+        subprocess.Popen(["open", "-a", "Terminal", script_path])
 
         # Return a "dummy" LaunchInformation
         return LaunchInformation(
             None, None, None
         )
 
+    def _write_launch_script(self, script_text):
+        """
+        Writes the launch script to the Toolkit cache folder, unless a script
+        with the same contents is already there, and removes the launch
+        scripts left behind by earlier launches.
+
+        The script holds the serialized context, including the user session,
+        so it is only readable by the current user.
+
+        :param str script_text: Contents of the shell script.
+        :returns: Full path to the launch script.
+        """
+        digest = hashlib.sha1(script_text.encode("utf-8")).hexdigest()[:16]
+        cache_dir = os.path.join(
+            LocalFileStorageManager.get_global_root(LocalFileStorageManager.CACHE),
+            "tk-blender",
+        )
+        script_path = os.path.join(cache_dir, f"blender_launch_{digest}.sh")
+
+        if os.path.exists(script_path):
+            # refresh its modification time so it is not pruned below
+            os.utime(script_path, None)
+        else:
+            filesystem.ensure_folder_exists(cache_dir)
+
+            # write to a temporary file first and move it into place, so an
+            # interrupted write never leaves a truncated script behind.
+            fd, tmp_path = tempfile.mkstemp(
+                dir=cache_dir, prefix=".blender_launch_", suffix=".sh"
+            )
+            try:
+                with os.fdopen(fd, "w") as script_file:
+                    script_file.write(script_text)
+                os.chmod(tmp_path, 0o700)
+                os.replace(tmp_path, script_path)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+
+        # Terminal opens the script as soon as it starts, so scripts older
+        # than this are no longer needed.
+        prune_time = time.time() - LAUNCH_SCRIPT_MAX_AGE
+        for old_script_path in glob.glob(
+            os.path.join(cache_dir, "blender_launch_*.sh")
+        ):
+            if old_script_path == script_path:
+                continue
+            try:
+                if os.path.getmtime(old_script_path) < prune_time:
+                    os.remove(old_script_path)
+            except OSError as e:
+                self.logger.debug(
+                    "Could not remove launch script %s: %s", old_script_path, e
+                )
+
+        return script_path
+
     def _icon_from_engine(self):
         """
         Use the default engine icon as blender does not supply
@@ -166,10 +250,7 @@ class BlenderLauncher(SoftwareLauncher):
 
         :returns: Full path to application icon as a string or None.
         """
-
-        # the engine icon
-        engine_icon = os.path.join(self.disk_location, "icon_256.png")
-        return engine_icon
+        return self._engine_icon_path
 
     def scan_software(self):
         """
@@ -194,6 +275,59 @@ class BlenderLauncher(SoftwareLauncher):
     def _find_software(self):
         """
         Find executables in the default install locations.
+
+        The result of the scan is cached and reused for as long as the
+        environment and the install locations are left untouched.
+        """
+        cache_key = self._software_cache_key()
+        if self._software_cache and self._software_cache[0] == cache_key:
+            self.logger.debug("Reusing cached Blender executables.")
+            return self._software_cache[1]
+
+        sw_versions = self._scan_executable_templates()
+        self._software_cache = (cache_key, sw_versions)
+        return sw_versions
+
+    def _template_parent_dirs(self):
+        """
+        Returns the deepest static folder of each executable template for
+        the current OS, that is, the folder that would change if a Blender
+        version was installed or removed.
+        """
+        parent_dirs = []
+        for executable_template in self.EXECUTABLE_TEMPLATES.get(sys.platform, []):
+            executable_template = os.path.expanduser(executable_template)
+            executable_template = os.path.expandvars(executable_template)
+            static_part = executable_template.split("{", 1)[0]
+            parent_dirs.append(os.path.dirname(static_part))
+        return parent_dirs
+
+    def _software_cache_key(self):
+        """
+        Builds the key used to decide if the cached executables are still
+        valid: the environment variables the templates depend on, and the
+        modification times of the folders they are found in.
+        """
+        dir_mtimes = []
+        for parent_dir in self._template_parent_dirs():
+            try:
+                dir_mtimes.append((parent_dir, os.path.getmtime(parent_dir)))
+            except OSError:
+                # folder does not exist (yet)
+                continue
+
+        return (
+            sys.platform,
+            os.environ.get("BLENDER_BIN_DIR"),
+            os.environ.get("USERPROFILE"),
+            os.environ.get("SGTK_BLENDER_CMD_EXTRA_ARGS"),
+            tuple(dir_mtimes),
+        )
+
+    def _scan_executable_templates(self):
+        """
+        Glob the executable templates for the current OS and build a
+        :class:`SoftwareVersion` for each executable found.
         """
 
         # all the executable templates for the current OS